@@ -1,6 +1,5 @@
 # app/main.py
 from __future__ import annotations
-import hashlib
 import os
 
 try:
@@ -17,7 +16,7 @@ from core.clock import Stopwatch, now_iso_utc
 from core.ingest import ingest
 from core.extract_ai import extract_ai
 from core.normalize import normalize
-from core.policy import load_policy, decide
+from core.policy import load_compiled_policy, decide, policy_sha256
 from core.artifacts import write_outbox_artifact
 from core.audit import write_run_bundle
 from core.types import DecisionArtifact
@@ -42,10 +41,10 @@ def run_gatekeeper(raw_text: str, metadata: dict | None = None):
     normalized = normalize(intake.raw_text, extraction)
 
     # 4. Policy gate
-    policy_doc, policy_text = load_policy(policy_version)
-    decision = decide(policy_doc, intake.raw_text, normalized)
+    policy_doc, policy_text, compiled_rules = load_compiled_policy(policy_version)
+    decision = decide(policy_doc, intake.raw_text, normalized, compiled_rules=compiled_rules)
     
-    policy_hash = hashlib.sha256(policy_text.encode("utf-8")).hexdigest()
+    policy_hash = policy_sha256(policy_text)
 
 
     # 5. Build artifact
@@ -81,6 +80,7 @@ def run_gatekeeper(raw_text: str, metadata: dict | None = None):
         normalized=normalized,
         decision=decision,
         policy_text=policy_text,
+        policy_hash=policy_hash,
     )
 
     return artifact, outbox_path, run_dir
@@ -1,16 +1,15 @@
 # app/ui_gradio.py
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any, Dict, List, Tuple
 
-import gradio as gr
-
 from app.main import run_gatekeeper
+from core.jsonio import dumps
 
 
 def _safe_json(obj: Any) -> str:
-    return json.dumps(obj, indent=2, ensure_ascii=False)
+    return dumps(obj).decode("utf-8")
 
 
 def _decision_badge(decision: str) -> str:
@@ -88,10 +87,11 @@ def _make_normalization_summary(artifact) -> str:
     return "\n".join(out)
 
 
-def _run_console(raw_text: str) -> Tuple[
+async def _run_console(raw_text: str) -> Tuple[
     str, str, str, List[List[Any]], str, str, str, str
 ]:
-    artifact, outbox_path, run_dir = run_gatekeeper(raw_text)
+    # Pipeline + serialization run on worker threads so the event loop stays free.
+    artifact, outbox_path, run_dir = await asyncio.to_thread(run_gatekeeper, raw_text)
 
     # Top card
     policy_version = artifact.policy_version
@@ -108,14 +108,15 @@ def _run_console(raw_text: str) -> Tuple[
         f"**Run bundle:** `{run_dir}`",
     ])
 
-    # Panels
-    normalized_json = _safe_json(artifact.normalized.model_dump())
-    policy_json = _safe_json(artifact.policy.model_dump())
-    record_json = _safe_json(artifact.normalized.record.model_dump())
+    # Panels (dump the artifact once; the sub-panels are slices of it)
+    full = await asyncio.to_thread(artifact.model_dump)
+    normalized_json = _safe_json(full["normalized"])
+    policy_json = _safe_json(full["policy"])
+    record_json = _safe_json(full["normalized"]["record"])
     extraction_rows = _flatten_extraction(artifact)
     policy_trace = _make_policy_trace(artifact)
     norm_summary = _make_normalization_summary(artifact)
-    full_artifact = _safe_json(artifact.model_dump())
+    full_artifact = _safe_json(full)
 
     return (
         header,
@@ -129,66 +130,76 @@ def _run_console(raw_text: str) -> Tuple[
     )
 
 
-with gr.Blocks(title="Gatekeeper Console") as demo:
-    gr.Markdown(
-        """
+def build_demo():
+    """
+    Builds the console UI. gradio is imported here rather than at module load,
+    so importing this module doesn't pay gradio's import cost.
+    """
+    import gradio as gr
+
+    with gr.Blocks(title="Gatekeeper Console") as demo:
+        gr.Markdown(
+            """
 # Gatekeeper Console
 **Policy-gated AI decision system**  
 Unstructured intake → evidence-bound extraction → deterministic normalization → policy decision → auditable artifact
 """
-    )
-
-    with gr.Row():
-        raw_input = gr.Textbox(
-            label="Raw Intake Text",
-            lines=7,
-            placeholder="Paste an intake request, incident report, or ticket text…",
         )
 
-    run_btn = gr.Button("Run Gatekeeper", variant="primary")
+        with gr.Row():
+            raw_input = gr.Textbox(
+                label="Raw Intake Text",
+                lines=7,
+                placeholder="Paste an intake request, incident report, or ticket text…",
+            )
 
-    # Decision card
-    decision_card = gr.Markdown()
+        run_btn = gr.Button("Run Gatekeeper", variant="primary")
+
+        # Decision card
+        decision_card = gr.Markdown()
+
+        with gr.Tabs():
+            with gr.Tab("Overview"):
+                norm_summary = gr.Markdown()
+                policy_trace = gr.Markdown()
+
+            with gr.Tab("Extraction"):
+                gr.Markdown("### Best candidates (per field)")
+                extraction_table = gr.Dataframe(
+                    headers=["field", "best_value", "confidence", "evidence_excerpt"],
+                    interactive=False,
+                    wrap=True,
+                )
+
+            with gr.Tab("Normalized Record"):
+                record_json = gr.Code(label="Canonical record", language="json")
+
+            with gr.Tab("Normalization Bundle"):
+                normalized_json = gr.Code(label="Normalized bundle (record + report)", language="json")
+
+            with gr.Tab("Policy Output"):
+                policy_json = gr.Code(label="Policy decision", language="json")
+
+            with gr.Tab("Full Artifact"):
+                full_artifact = gr.Code(label="Decision artifact JSON", language="json")
+
+        run_btn.click(
+            fn=_run_console,
+            inputs=[raw_input],
+            outputs=[
+                decision_card,
+                norm_summary,
+                policy_trace,
+                extraction_table,
+                record_json,
+                normalized_json,
+                policy_json,
+                full_artifact,
+            ],
+        )
 
-    with gr.Tabs():
-        with gr.Tab("Overview"):
-            norm_summary = gr.Markdown()
-            policy_trace = gr.Markdown()
+    return demo
 
-        with gr.Tab("Extraction"):
-            gr.Markdown("### Best candidates (per field)")
-            extraction_table = gr.Dataframe(
-                headers=["field", "best_value", "confidence", "evidence_excerpt"],
-                interactive=False,
-                wrap=True,
-            )
-
-        with gr.Tab("Normalized Record"):
-            record_json = gr.Code(label="Canonical record", language="json")
-
-        with gr.Tab("Normalization Bundle"):
-            normalized_json = gr.Code(label="Normalized bundle (record + report)", language="json")
-
-        with gr.Tab("Policy Output"):
-            policy_json = gr.Code(label="Policy decision", language="json")
-
-        with gr.Tab("Full Artifact"):
-            full_artifact = gr.Code(label="Decision artifact JSON", language="json")
-
-    run_btn.click(
-        fn=_run_console,
-        inputs=[raw_input],
-        outputs=[
-            decision_card,
-            norm_summary,
-            policy_trace,
-            extraction_table,
-            record_json,
-            normalized_json,
-            policy_json,
-            full_artifact,
-        ],
-    )
 
 if __name__ == "__main__":
-    demo.launch()
+    build_demo().launch()
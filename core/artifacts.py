@@ -1,15 +1,19 @@
 # core/artifacts.py
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Any
 
+from pydantic import TypeAdapter
+
+from core.fsio import write_bytes
 from core.types import DecisionArtifact
 
 
 OUTBOX_DIR = Path("outbox")
 
+# dump_json returns UTF-8 bytes directly (no intermediate str to re-encode)
+_ARTIFACT_JSON = TypeAdapter(DecisionArtifact)
+
 
 def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
@@ -27,7 +31,8 @@ def write_outbox_artifact(artifact: DecisionArtifact) -> Path:
     _ensure_dir(folder)
 
     path = folder / f"{artifact.run_id}.json"
-    payload: Any = artifact.model_dump(mode="json", exclude_none=False)
 
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    # Serialize straight from the model into one bytes buffer and write it once.
+    payload = _ARTIFACT_JSON.dump_json(artifact, indent=2, exclude_none=False)
+    write_bytes(path, payload)
     return path
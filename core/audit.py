@@ -1,25 +1,34 @@
 # core/audit.py
 from __future__ import annotations
 
-import json
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
+from core.fsio import sync_dir, write_bytes
+from core.jsonio import dumps
 from core.types import IntakeEnvelope, ExtractionResult, NormalizedBundle, PolicyDecision
 
 
-
-def _sha256(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
-
 RUNS_DIR = Path("runs")
 
+# Shared by all runs; threads are started lazily on first use.
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gk-audit")
+
 
 def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
+def _write_files(run_dir: Path, files: List[Tuple[str, bytes]]) -> None:
+    """
+    The writes are independent and release the GIL, so they are overlapped
+    on a shared thread pool.
+    """
+    list(_IO_POOL.map(lambda f: write_bytes(run_dir / f[0], f[1]), files))
+
+
 def write_run_bundle(
     run_id: str,
     config: Dict[str, Any],
@@ -28,6 +37,7 @@ def write_run_bundle(
     normalized: NormalizedBundle,
     decision: PolicyDecision,
     policy_text: str,
+    policy_hash: Optional[str] = None,
 ) -> Path:
     """
     Writes a replayable audit bundle:
@@ -37,37 +47,35 @@ def write_run_bundle(
       runs/<run_id>/policy.json
       runs/<run_id>/config.json
       runs/<run_id>/policy.yaml
+
+    policy_hash may be passed in when the caller already has it; otherwise
+    it is computed from policy_text.
     """
     run_dir = RUNS_DIR / run_id
     _ensure_dir(run_dir)
 
-    (run_dir / "raw.json").write_text(
-        json.dumps(intake.model_dump(mode="json"), indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
-    (run_dir / "extraction.json").write_text(
-        json.dumps(extraction.model_dump(mode="json"), indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
-    (run_dir / "normalized.json").write_text(
-        json.dumps(normalized.model_dump(mode="json"), indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
-    (run_dir / "policy.json").write_text(
-        json.dumps(decision.model_dump(mode="json"), indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
-
-    # ✅ Snapshot the exact policy YAML used
-    (run_dir / "policy.yaml").write_text(policy_text, encoding="utf-8")
+    policy_bytes = policy_text.encode("utf-8")
 
     # ✅ Record a hash of the exact policy snapshot
     config = dict(config)
-    config["policy_hash"] = _sha256(policy_text)
+    config["policy_hash"] = policy_hash or hashlib.sha256(policy_bytes).hexdigest()
+
+    # Serialize everything up front, then hit the filesystem in one pass.
+    # Models go straight to JSON via pydantic-core (no intermediate dict).
+    files: List[Tuple[str, bytes]] = [
+        ("raw.json", intake.model_dump_json(indent=2).encode("utf-8")),
+        ("extraction.json", extraction.model_dump_json(indent=2).encode("utf-8")),
+        ("normalized.json", normalized.model_dump_json(indent=2).encode("utf-8")),
+        ("policy.json", decision.model_dump_json(indent=2).encode("utf-8")),
+        # ✅ Snapshot the exact policy YAML used
+        ("policy.yaml", policy_bytes),
+    ]
+    _write_files(run_dir, files)
 
-    (run_dir / "config.json").write_text(
-        json.dumps(config, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    # config.json goes last and is the only file flushed, then one directory
+    # sync covers all six entries: two syncs per bundle instead of one per file.
+    # The other files' contents are left to the page cache, as before.
+    write_bytes(run_dir / "config.json", dumps(config), sync=True)
+    sync_dir(run_dir)
 
     return run_dir
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from openai import OpenAI
 from pydantic import BaseModel, Field
 
 from core.types import (
@@ -14,6 +15,9 @@ from core.types import (
     EvidenceSpan,
 )
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 FIELDS = [
     "summary",
     "category",
@@ -24,6 +28,9 @@ FIELDS = [
     "requested_action",
 ]
 
+# (name, getter) pairs resolved once; attrgetter is C-implemented
+_FIELD_GETTERS = tuple((f, attrgetter(f)) for f in FIELDS)
+
 
 SYSTEM_PROMPT = """You are Gatekeeper's Extraction Sensor.
 
@@ -86,19 +93,45 @@ def _find_span(raw: str, snippet: str) -> EvidenceSpan:
     return EvidenceSpan(text=snippet, start=idx, end=idx + len(snippet))
 
 
-def _convert_field(raw_text: str, name: str, candidates: List[Candidate]) -> ExtractedField:
-    ef = ExtractedField(field=name, candidates=[])
+def _find_spans(raw: str, snippets: List[str]) -> Dict[str, EvidenceSpan]:
+    """
+    Locates each distinct non-empty snippet once (str.find is already a
+    C-level search). Offsets are char indices into raw, matching EvidenceSpan.
+    """
+    spans: Dict[str, EvidenceSpan] = {}
+    for snippet in snippets:
+        if snippet and snippet not in spans:
+            spans[snippet] = _find_span(raw, snippet)
+    return spans
+
+
+def _is_unknown(value: Any) -> bool:
+    # Length check first: most values are rejected without allocating upper()
+    return isinstance(value, str) and len(value) == 7 and value.upper() == "UNKNOWN"
+
+
+def _keep_candidates(candidates: List[Candidate]) -> List[Candidate]:
+    return [c for c in candidates[:2] if not _is_unknown(c.value)]
 
-    for c in candidates[:2]:
-        if isinstance(c.value, str) and c.value.upper() == "UNKNOWN":
-            continue
 
-        evidence = _find_span(raw_text, c.evidence)
+def _convert_field(
+    name: str,
+    candidates: List[Candidate],
+    spans: Dict[str, EvidenceSpan],
+) -> ExtractedField:
+    """
+    candidates are already filtered by _keep_candidates; spans must cover
+    every candidate's non-empty evidence (see _find_spans).
+    """
+    ef = ExtractedField(field=name, candidates=[])
+
+    for c in candidates:
+        evidence = spans[c.evidence] if c.evidence else None
 
         ef.candidates.append(
             ExtractedCandidate(
                 value=c.value,
-                evidence=evidence if evidence.text else None,
+                evidence=evidence,
                 confidence=c.confidence,
             )
         )
@@ -106,10 +139,23 @@ def _convert_field(raw_text: str, name: str, candidates: List[Candidate]) -> Ext
     return ef
 
 
+@lru_cache(maxsize=1)
+def _get_client() -> OpenAI:
+    """
+    One client per process: reuses its HTTP connection pool (keep-alive + TLS
+    session) across runs instead of rebuilding it per call. Created lazily so
+    env vars loaded at startup (e.g. via dotenv) are picked up. The SDK itself
+    is imported here too, so importing this module stays cheap.
+    """
+    from openai import OpenAI
+
+    return OpenAI()
+
+
 # ---------- Main extractor ----------
 
 def extract_ai(raw_text: str, model: str) -> ExtractionResult:
-    client = OpenAI()
+    client = _get_client()
 
     resp = client.responses.parse(
         model=model,
@@ -143,9 +189,14 @@ Extract candidates for:
             notes="No structured output returned.",
         )
 
+    kept = [(name, _keep_candidates(get(parsed.fields))) for name, get in _FIELD_GETTERS]
+
+    # Resolve every field's evidence against raw_text in a single batch
+    spans = _find_spans(raw_text, [c.evidence for _, cands in kept for c in cands])
+
     fields: Dict[str, ExtractedField] = {}
-    for f in FIELDS:
-        fields[f] = _convert_field(raw_text, f, getattr(parsed.fields, f))
+    for name, cands in kept:
+        fields[name] = _convert_field(name, cands, spans)
 
     return ExtractionResult(
         model=model,
@@ -0,0 +1,41 @@
+# core/fsio.py
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# Platform fallback: fdatasync is POSIX-only
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def write_bytes(path: Path, data: bytes, *, sync: bool = False) -> None:
+    """
+    Writes pre-serialized bytes with one open/write/close and no text-layer
+    encoding in between. sync=True flushes the file's data before closing.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if sync:
+            _fdatasync(fd)
+    finally:
+        os.close(fd)
+
+
+def sync_dir(path: Path) -> None:
+    """
+    Makes the directory's entries durable; one sync covers every file in it.
+    Best effort: skipped where directories cannot be opened/synced (e.g. Windows).
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        _fdatasync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -1,12 +1,16 @@
 # core/ids.py
 from __future__ import annotations
 
-import secrets
-from datetime import datetime, timezone
+import os
+import time
 
 
 def new_run_id(prefix: str = "gk") -> str:
     # Example: gk_20251218T013045Z_8f2c1a9b
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    rnd = secrets.token_hex(4)
+    t = time.gmtime(time.time_ns() // 1_000_000_000)
+    ts = (
+        f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}Z"
+    )
+    rnd = os.urandom(4).hex()
     return f"{prefix}_{ts}_{rnd}"
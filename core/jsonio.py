@@ -0,0 +1,25 @@
+# core/jsonio.py
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Pretty-printed UTF-8 JSON (2-space indent, non-ASCII kept as-is).
+    Uses orjson when installed; falls back to the stdlib encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Parses JSON from bytes or str (orjson when installed, stdlib otherwise).
+# Bound directly rather than wrapped, so callers pay no extra call per parse.
+loads = orjson.loads if orjson is not None else json.loads
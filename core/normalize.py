@@ -35,29 +35,42 @@ INJECTION_PATTERNS = [
     r"\bpolicy override\b",
 ]
 
-def _has_injection(text: str) -> bool:
-    t = text.lower()
-    return any(re.search(p, t) for p in INJECTION_PATTERNS)
 
+# Each group is compiled once into a single case-insensitive alternation, so a
+# check is one C-level scan with no per-pattern loop and no lowered copy.
+_RELATIVE_TIME_RE = re.compile(
+    "|".join(f"(?:{p})" for p in RELATIVE_TIME_PATTERNS), re.IGNORECASE
+)
+_INJECTION_RE = re.compile(
+    "|".join(f"(?:{p})" for p in INJECTION_PATTERNS), re.IGNORECASE
+)
+
+
+def _has_injection(text: str) -> bool:
+    return _INJECTION_RE.search(text) is not None
 
 
 def _has_relative_time(text: str) -> bool:
-    t = text.lower()
-    return any(re.search(p, t) for p in RELATIVE_TIME_PATTERNS)
+    return _RELATIVE_TIME_RE.search(text) is not None
+
+
+_NO_PICK: Tuple[Optional[object], bool] = (None, False)
 
 
-def _pick_best(extraction: ExtractionResult, field: str) -> Tuple[Optional[object], bool]:
+def _pick_all(extraction: ExtractionResult) -> Dict[str, Tuple[Optional[object], bool]]:
     """
-    Returns (value, has_evidence)
+    One pass over the extracted fields.
+    Returns {field: (value, has_evidence)}; absent fields are omitted.
     """
-    f = extraction.fields.get(field)
-    if not f:
-        return None, False
-    best = f.best()
-    if not best:
-        return None, False
-    has_evidence = best.evidence is not None and bool(best.evidence.text.strip())
-    return best.value, has_evidence
+    picks: Dict[str, Tuple[Optional[object], bool]] = {}
+    for name, f in extraction.fields.items():
+        best = f.best() if f else None
+        if not best:
+            picks[name] = _NO_PICK
+            continue
+        has_evidence = best.evidence is not None and bool(best.evidence.text.strip())
+        picks[name] = (best.value, has_evidence)
+    return picks
 
 
 def normalize(intake_text: str, extraction: ExtractionResult) -> NormalizedBundle:
@@ -67,17 +80,19 @@ def normalize(intake_text: str, extraction: ExtractionResult) -> NormalizedBundl
     """
 
     # Pull best candidates
-    summary, summary_ev = _pick_best(extraction, "summary")
-    category, category_ev = _pick_best(extraction, "category")
-    location, location_ev = _pick_best(extraction, "location")
-
-    event_time, _ = _pick_best(extraction, "event_time")
-    severity, sev_ev = _pick_best(extraction, "severity")
-    people_involved, _ = _pick_best(extraction, "people_involved")
-    requested_action, _ = _pick_best(extraction, "requested_action")
-
-    # Canonicalize types safely
-    record = NormalizedRecord(
+    picks = _pick_all(extraction)
+    summary, summary_ev = picks.get("summary", _NO_PICK)
+    category, category_ev = picks.get("category", _NO_PICK)
+    location, location_ev = picks.get("location", _NO_PICK)
+
+    event_time, _ = picks.get("event_time", _NO_PICK)
+    severity, sev_ev = picks.get("severity", _NO_PICK)
+    people_involved, _ = picks.get("people_involved", _NO_PICK)
+    requested_action, _ = picks.get("requested_action", _NO_PICK)
+
+    # Canonicalize types safely. Every value below is already a str/None/list
+    # of the right shape, so the internal models are built without re-validation.
+    record = NormalizedRecord.model_construct(
         summary=str(summary).strip() if isinstance(summary, str) and summary.strip() else None,
         category=str(category).strip() if isinstance(category, str) and category.strip() else None,
         location=str(location).strip() if isinstance(location, str) and location.strip() else None,
@@ -117,10 +132,10 @@ def normalize(intake_text: str, extraction: ExtractionResult) -> NormalizedBundl
         flags.append(QualityFlag.PROMPT_INJECTION_ATTEMPT)
 
 
-    report = NormalizationReport(
+    report = NormalizationReport.model_construct(
         missing_required=missing_required,
         flags=flags,
         canonical=record,
     )
 
-    return NormalizedBundle(record=record, report=report)
+    return NormalizedBundle.model_construct(record=record, report=report)
@@ -1,41 +1,82 @@
 # core/policy.py
 from __future__ import annotations
 
+import hashlib
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 import yaml
 
 from core.types import PolicyDecision, ReasonCode, Decision
-from policies.v1.rules import eval_when_block
+from policies.v1.rules import compile_rules, eval_context
 
+# libyaml's C loader when available (much faster), pure-Python otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def load_policy(policy_version: str) -> Tuple[Dict[str, Any], str]:
+
+@lru_cache(maxsize=16)
+def _load_cached(path_str: str, mtime_ns: int) -> Tuple[Dict[str, Any], str, Tuple[Any, ...]]:
+    # mtime_ns is part of the cache key only: an edited file gets a new entry.
+    # Compiled rules live in the same entry, so they're evicted with their doc.
+    policy_text = Path(path_str).read_text(encoding="utf-8")
+    policy_doc = yaml.load(policy_text, Loader=_YamlLoader)
+    return policy_doc, policy_text, compile_rules(policy_doc)
+
+
+def load_compiled_policy(policy_version: str) -> Tuple[Dict[str, Any], str, Tuple[Any, ...]]:
     """
-    Returns (policy_doc, policy_text) so we can snapshot the exact YAML used.
+    Returns (policy_doc, policy_text, compiled_rules); pass compiled_rules to
+    decide() to skip compiling the `when` blocks on every run.
+    Parsed policies are cached per (path, mtime), so repeat runs skip the YAML parse.
+    The returned doc is shared between calls and must not be mutated.
     """
     path = Path("policies") / policy_version / "policy.yaml"
-    if not path.exists():
-        raise FileNotFoundError(f"Policy file not found: {path}")
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Policy file not found: {path}") from None
+
+    return _load_cached(str(path), mtime_ns)
 
-    policy_text = path.read_text(encoding="utf-8")
-    policy_doc = yaml.safe_load(policy_text)
+
+def load_policy(policy_version: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Returns (policy_doc, policy_text) so we can snapshot the exact YAML used.
+    """
+    policy_doc, policy_text, _ = load_compiled_policy(policy_version)
     return policy_doc, policy_text
 
 
+@lru_cache(maxsize=16)
+def policy_sha256(policy_text: str) -> str:
+    """
+    Hash of the exact policy snapshot. load_policy hands back the same cached
+    text for an unchanged file, so repeat runs skip encoding + hashing.
+    """
+    return hashlib.sha256(policy_text.encode("utf-8")).hexdigest()
+
+
 def decide(
     policy_doc: Dict[str, Any],
     raw_text: str,
     normalized_bundle,
+    compiled_rules: Optional[Sequence[Any]] = None,
 ) -> PolicyDecision:
     """
     Deterministic policy evaluation: first match wins.
+    compiled_rules must come from the same policy_doc (see load_compiled_policy);
+    without it the rules are compiled for this call only.
     """
     rules = policy_doc.get("rules", [])
-    for rule in rules:
+    if compiled_rules is None:
+        compiled_rules = compile_rules(policy_doc)
+
+    ctx = eval_context(normalized_bundle)
+    for rule, matches in zip(rules, compiled_rules):
         rule_id = rule.get("id", "UNKNOWN_RULE")
-        when = rule.get("when", {})
-        if eval_when_block(when, raw_text=raw_text, normalized=normalized_bundle):
+        if matches(raw_text, normalized_bundle, ctx):
             then = rule.get("then", {})
             decision: Decision = then.get("decision", "ESCALATED")
 
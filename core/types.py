@@ -77,7 +77,8 @@ class ExtractedField(BaseModel):
     def best(self) -> Optional[ExtractedCandidate]:
         if not self.candidates:
             return None
-        return sorted(self.candidates, key=lambda c: c.confidence, reverse=True)[0]
+        # max() keeps the first of equal-confidence candidates, like the stable sort did
+        return max(self.candidates, key=lambda c: c.confidence)
 
 
 class ExtractionResult(BaseModel):
@@ -1,37 +1,41 @@
 # evals/invariants.py
 from __future__ import annotations
 
+from typing import Tuple
+
 from core.types import DecisionArtifact, QualityFlag, ReasonCode
 
+# Each invariant returns (ok, message); message is "" when ok.
+InvariantResult = Tuple[bool, str]
+
+_OK: InvariantResult = (True, "")
+
 
-def invariant_missing_required_never_accept(artifact: DecisionArtifact):
-    if artifact.normalized.report.missing_required:
-        assert artifact.decision != "ACCEPTED", (
-            "Invariant violated: ACCEPTED despite missing required fields"
-        )
+def invariant_missing_required_never_accept(artifact: DecisionArtifact) -> InvariantResult:
+    if artifact.normalized.report.missing_required and artifact.decision == "ACCEPTED":
+        return False, "Invariant violated: ACCEPTED despite missing required fields"
+    return _OK
 
 
-def invariant_relative_time_never_accept(artifact: DecisionArtifact):
+def invariant_relative_time_never_accept(artifact: DecisionArtifact) -> InvariantResult:
     flags = artifact.normalized.report.flags
-    if QualityFlag.RELATIVE_TIME_UNRESOLVED in flags:
-        assert artifact.decision != "ACCEPTED", (
-            "Invariant violated: ACCEPTED with unresolved relative time"
-        )
+    if QualityFlag.RELATIVE_TIME_UNRESOLVED in flags and artifact.decision == "ACCEPTED":
+        return False, "Invariant violated: ACCEPTED with unresolved relative time"
+    return _OK
 
 
-def invariant_rejected_has_reason(artifact: DecisionArtifact):
-    if artifact.decision == "REJECTED":
-        assert artifact.policy.reason_codes, (
-            "Invariant violated: REJECTED without reason codes"
-        )
+def invariant_rejected_has_reason(artifact: DecisionArtifact) -> InvariantResult:
+    if artifact.decision == "REJECTED" and not artifact.policy.reason_codes:
+        return False, "Invariant violated: REJECTED without reason codes"
+    return _OK
 
 
-def invariant_accepted_schema_complete(artifact: DecisionArtifact):
+def invariant_accepted_schema_complete(artifact: DecisionArtifact) -> InvariantResult:
     if artifact.decision == "ACCEPTED":
         missing = artifact.normalized.report.missing_required
-        assert not missing, (
-            f"Invariant violated: ACCEPTED with missing fields {missing}"
-        )
+        if missing:
+            return False, f"Invariant violated: ACCEPTED with missing fields {missing}"
+    return _OK
 
 
 INVARIANTS = [
@@ -40,3 +44,13 @@ INVARIANTS = [
     invariant_rejected_has_reason,
     invariant_accepted_schema_complete,
 ]
+
+
+def assert_invariants(artifact: DecisionArtifact) -> None:
+    """
+    Assert-style check for debugging (e.g. from a REPL or pdb): raises
+    AssertionError with the first violated invariant's message.
+    """
+    for inv in INVARIANTS:
+        ok, msg = inv(artifact)
+        assert ok, msg
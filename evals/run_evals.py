@@ -1,62 +1,120 @@
 # evals/run_evals.py
 from __future__ import annotations
 
-import json
+import hashlib
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict
 
 from app.main import run_gatekeeper
+from core.jsonio import loads
 from evals.invariants import INVARIANTS
 
 
 CASES_PATH = Path("evals/cases.jsonl")
 
 
+def _fuse(invariants):
+    """
+    Generates a single check function that calls each invariant in order
+    (straight-line code, no per-case loop over the list). It returns the
+    first violation message, or None when every invariant holds.
+    """
+    names = [f"_inv{i}" for i in range(len(invariants))]
+    body = "".join(
+        f"    ok, msg = {n}(artifact)\n    if not ok:\n        return msg\n" for n in names
+    ) + "    return None\n"
+    namespace = dict(zip(names, invariants))
+    exec(f"def check_invariants(artifact):\n{body}", namespace)
+    return namespace["check_invariants"]
+
+
+_check_invariants = _fuse(INVARIANTS)
+
+
 def load_cases():
-    cases = []
-    with CASES_PATH.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            cases.append(json.loads(line))
-    return cases
+    """
+    Yields cases one at a time (both parsers accept raw UTF-8 bytes).
+    The file is read once and walked line by line with find(), so no
+    split list or stripped copies are built.
+    """
+    data = CASES_PATH.read_bytes()
+    pos, size = 0, len(data)
+    while pos < size:
+        end = data.find(b"\n", pos)
+        if end == -1:
+            end = size
+        line = data[pos:end]
+        pos = end + 1
+        if line and not line.isspace():
+            yield loads(line)
+
+
+def _run_raw(raw: str):
+    """
+    Worker-process side: runs the pipeline only. Checks happen in the parent,
+    so only artifacts cross the process boundary.
+    """
+    artifact, _, _ = run_gatekeeper(raw)
+    return artifact
+
+
+def _report(cid, artifact, expected, must_not_be) -> int:
+    """
+    Writes one case's result line(s) in a single stdout write; returns the
+    number of failures.
+    """
+    failures = 0
+    parts = [f"[{cid}] decision={artifact.decision}"]
+
+    # Expected decision check (soft assertion)
+    if expected and artifact.decision != expected:
+        parts.append(f"  ❌ expected={expected}")
+        failures += 1
+    else:
+        parts.append("  ✅")
+
+    # Invariant checks (hard failures)
+    violation = _check_invariants(artifact)
+    if violation is None:
+        parts.append("  invariants=PASS\n")
+    else:
+        parts.append(f"\n    🔥 INVARIANT FAILED: {violation}\n")
+        failures += 1
+    if must_not_be and artifact.decision == must_not_be:
+        parts.append(f"  🔥 must_not_be violated: {must_not_be}\n")
+        failures += 1
+
+    sys.stdout.write("".join(parts))
+    return failures
 
 
 def run():
-    cases = load_cases()
     failures = 0
 
     print("\nGatekeeper — Evaluation Run\n")
 
-    for case in cases:
-        cid = case["id"]
-        raw = case["raw_text"]
-        expected = case.get("expected_decision")
-
-        artifact, _, _ = run_gatekeeper(raw)
-
-        print(f"[{cid}] decision={artifact.decision}", end="")
-
-        # Expected decision check (soft assertion)
-        if expected and artifact.decision != expected:
-            print(f"  ❌ expected={expected}", end="")
-            failures += 1
-        else:
-            print("  ✅", end="")
-
-        # Invariant checks (hard assertions)
-        try:
-            for inv in INVARIANTS:
-                inv(artifact)
-            print("  invariants=PASS")
-        except AssertionError as e:
-            print(f"\n    🔥 INVARIANT FAILED: {e}")
-            failures += 1
-        must_not_be = case.get("must_not_be")
-        if must_not_be and artifact.decision == must_not_be:
-            print(f"  🔥 must_not_be violated: {must_not_be}")
-            failures += 1
-
+    # Cases are independent, so fan them out across processes. Duplicate
+    # raw_text values (keyed by content hash) run once and share the artifact.
+    # Results are reported in file order, which keeps the output deterministic.
+    with ProcessPoolExecutor() as pool:
+        runs: Dict[bytes, Future] = {}
+        pending = []
+        for case in load_cases():
+            raw = case["raw_text"]
+            key = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+            if key not in runs:
+                runs[key] = pool.submit(_run_raw, raw)
+            pending.append((case, runs[key]))
+
+        for case, fut in pending:
+            failures += _report(
+                case["id"],
+                fut.result(),
+                case.get("expected_decision"),
+                case.get("must_not_be"),
+            )
 
     print("\n----------------------------")
     if failures:
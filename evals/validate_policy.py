@@ -1,6 +1,23 @@
+import hashlib
 from pathlib import Path
 import yaml
 
+# libyaml's C loader when available (much faster), pure-Python otherwise
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# A marker per policy content hash that has already parsed cleanly
+CACHE_DIR = Path.home() / ".cache" / "gatekeeper"
+
 p = Path("policies/v1/policy.yaml")
-yaml.safe_load(p.read_text(encoding="utf-8"))
+data = p.read_bytes()
+marker = CACHE_DIR / f"policy-{hashlib.blake2b(data, digest_size=16).hexdigest()}.ok"
+
+if not marker.exists():
+    yaml.load(data.decode("utf-8"), Loader=SafeLoader)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except OSError:
+        pass  # cache is best effort
+
 print("policy.yaml is valid YAML ✅")
@@ -1,16 +1,24 @@
 # policies/v1/rules.py
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
 from core.types import NormalizedBundle, QualityFlag
 
 
 def is_empty_input(raw_text: str) -> bool:
-    return raw_text is None or not raw_text.strip()
+    """
+    True for None, "" or whitespace-only input (same as `not raw_text.strip()`,
+    without allocating a stripped copy).
+    """
+    return not raw_text or raw_text.isspace()
 
 def field_missing(*, normalized, field: str, **_) -> bool:
-    v = getattr(normalized.record, field, None)
+    return _is_missing(getattr(normalized.record, field, None))
+
+
+def _is_missing(v: Any) -> bool:
     if v is None:
         return True
     if isinstance(v, str) and not v.strip():
@@ -21,24 +29,39 @@ def field_missing(*, normalized, field: str, **_) -> bool:
 
 def field_not_in(*, normalized, field: str, values: List[str], **_) -> bool:
     v = getattr(normalized.record, field, None)
+    return _not_in(v, _to_frozenset(tuple(values) if values else ()))
+
+
+def _not_in(v: Any, allowed: FrozenSet[str]) -> bool:
     # If missing, let the missing-category rule handle it (don’t call it invalid)
     if v is None:
         return False
     if isinstance(v, str) and not v.strip():
         return False
-    return str(v).strip() not in set(values or [])
+    return str(v).strip() not in allowed
 
 
-def flag_present(normalized: NormalizedBundle, flag: str) -> bool:
+@lru_cache(maxsize=256)
+def _to_frozenset(values: Tuple[str, ...]) -> FrozenSet[str]:
+    # Policy value lists are fixed per rule; build each lookup set once.
+    return frozenset(values)
+
+
+@lru_cache(maxsize=64)
+def _coerce_flag(flag: str) -> Optional[QualityFlag]:
     try:
-        qf = QualityFlag(flag)
+        return QualityFlag(flag)
     except Exception:
-        return False
-    return qf in normalized.report.flags
+        return None
+
+
+def flag_present(normalized: NormalizedBundle, flag: str) -> bool:
+    qf = _coerce_flag(flag) if isinstance(flag, str) else None
+    return qf is not None and qf in normalized.report.flags
 
 
 def missing_required(normalized: NormalizedBundle) -> bool:
-    return len(normalized.report.missing_required) > 0
+    return bool(normalized.report.missing_required)
 
 
 def no_blockers(normalized: NormalizedBundle) -> bool:
@@ -48,7 +71,7 @@ def no_blockers(normalized: NormalizedBundle) -> bool:
       - no RELATIVE_TIME_UNRESOLVED flag
     (We keep this conservative.)
     """
-    if missing_required(normalized):
+    if normalized.report.missing_required:
         return False
     if QualityFlag.RELATIVE_TIME_UNRESOLVED in normalized.report.flags:
         return False
@@ -84,6 +107,146 @@ def eval_condition(
     return False
 
 
+# A compiled `when` block: (raw_text, normalized) -> matched?
+Check = Callable[[str, NormalizedBundle], bool]
+
+
+class EvalContext(NamedTuple):
+    """
+    Per-evaluation snapshot of a bundle, built once and shared by every
+    compiled check. Never cached on the bundle, so it can't go stale.
+    """
+    record: Dict[str, Any]                  # record field values (pydantic v2 __dict__)
+    has_missing_required: bool
+
+
+def eval_context(normalized: NormalizedBundle) -> EvalContext:
+    return EvalContext(
+        record=vars(normalized.record),
+        has_missing_required=bool(normalized.report.missing_required),
+    )
+
+
+# A compiled single check: (raw_text, normalized, ctx) -> matched?
+_CtxCheck = Callable[[str, NormalizedBundle, EvalContext], bool]
+
+# Rough relative cost per condition; checks run cheapest first so any/all
+# short-circuit as early as possible. Unknown conditions are cheapest (always False).
+_CONDITION_COST = {
+    "empty_input": 1,
+    "flag_present": 2,
+    "field_missing": 2,
+    "field_not_in": 3,
+    "missing_required": 4,
+    "no_blockers": 5,
+}
+
+
+def _never(raw_text: str, normalized: NormalizedBundle, ctx: Any = None) -> bool:
+    return False
+
+
+def _compile_check(c: Dict[str, Any]) -> _CtxCheck:
+    """
+    Resolves one check's condition and arguments once, mirroring
+    eval_condition, and returns a closure over them.
+    """
+    condition = c["condition"]
+    value: Optional[str] = c.get("value")
+    field: Optional[str] = c.get("field")
+
+    if condition == "empty_input":
+        return lambda raw_text, normalized, ctx: is_empty_input(raw_text)
+
+    if condition == "flag_present":
+        qf = _coerce_flag(value) if value and isinstance(value, str) else None
+        if qf is None:
+            return _never
+        return lambda raw_text, normalized, ctx: qf in normalized.report.flags
+
+    if condition == "field_missing":
+        if not field:
+            return _never
+        return lambda raw_text, normalized, ctx: _is_missing(ctx.record.get(field))
+
+    if condition == "field_not_in":
+        if not field:
+            return _never
+        values = c.get("values")
+        allowed = _to_frozenset(tuple(values) if values else ())
+        return lambda raw_text, normalized, ctx: _not_in(ctx.record.get(field), allowed)
+
+    if condition == "missing_required":
+        return lambda raw_text, normalized, ctx: ctx.has_missing_required
+
+    if condition == "no_blockers":
+        return lambda raw_text, normalized, ctx: (
+            not ctx.has_missing_required
+            and QualityFlag.RELATIVE_TIME_UNRESOLVED not in normalized.report.flags
+        )
+
+    return _never
+
+
+def _compile_checks(checks: List[Dict[str, Any]], preserve_order: bool) -> Tuple[_CtxCheck, ...]:
+    if not preserve_order:
+        # Conditions are pure, so order doesn't change the result, only the cost.
+        checks = sorted(checks, key=lambda c: _CONDITION_COST.get(c["condition"], 0))
+    return tuple(_compile_check(c) for c in checks)
+
+
+def _compile_when(when: Dict[str, Any], preserve_order: bool) -> _CtxCheck:
+    if not when:
+        return _never
+
+    if "any" in when:
+        any_checks = _compile_checks(when["any"], preserve_order)
+
+        def _any(raw_text: str, normalized: NormalizedBundle, ctx: EvalContext) -> bool:
+            return any(chk(raw_text, normalized, ctx) for chk in any_checks)
+
+        return _any
+
+    if "all" in when:
+        all_checks = _compile_checks(when["all"], preserve_order)
+
+        def _all(raw_text: str, normalized: NormalizedBundle, ctx: EvalContext) -> bool:
+            return all(chk(raw_text, normalized, ctx) for chk in all_checks)
+
+        return _all
+
+    return _never
+
+
+def compile_rules(policy_doc: Dict[str, Any], preserve_order: bool = False) -> Tuple[_CtxCheck, ...]:
+    """
+    Compiles every rule's `when` block, in rule order. Each compiled check is
+    called as check(raw_text, normalized, eval_context(normalized)), so one
+    context can be shared across all rules of a single decision.
+
+    Checks are reordered cheapest-first; pass preserve_order=True to evaluate
+    them in YAML order (e.g. when debugging a policy).
+    """
+    return tuple(
+        _compile_when(rule.get("when", {}), preserve_order)
+        for rule in policy_doc.get("rules", [])
+    )
+
+
+def compile_when(when: Dict[str, Any], preserve_order: bool = False) -> Check:
+    """
+    Compiles a single `when` block into a (raw_text, normalized) callable.
+    Nothing is cached here; core.policy keeps compiled rules alongside the
+    cached policy doc.
+    """
+    compiled = _compile_when(when, preserve_order)
+
+    def _check(raw_text: str, normalized: NormalizedBundle) -> bool:
+        return compiled(raw_text, normalized, eval_context(normalized))
+
+    return _check
+
+
 def eval_when_block(
     when: Dict[str, Any],
     raw_text: str,
@@ -95,11 +258,14 @@ def eval_when_block(
         any: [ {condition: ...}, ... ]
       when:
         all: [ {condition: ...}, ... ]
+
+    Interprets the block on every call; decide() uses the rules compiled
+    once per policy load instead (see compile_rules).
     """
     if "any" in when:
         checks: List[Dict[str, Any]] = when["any"]
         return any(
-           eval_condition(
+            eval_condition(
                 c["condition"],
                 raw_text,
                 normalized,
@@ -113,14 +279,14 @@ def eval_when_block(
     if "all" in when:
         checks: List[Dict[str, Any]] = when["all"]
         return all(
-           eval_condition(
+            eval_condition(
                 c["condition"],
                 raw_text,
                 normalized,
                 c.get("value"),
                 c.get("field"),
                 c.get("values"),
-            )            
+            )
             for c in checks
         )
 